@@ -1,9 +1,8 @@
 """The Bang & Olufsen integration."""
 from __future__ import annotations
 
+from functools import partial
 import logging
-from multiprocessing.pool import ApplyResult
-from typing import cast
 
 from mozart_api.models import (
     BatteryState,
@@ -132,13 +131,9 @@ async def init_entities(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Check connection and try to initialize it.
     try:
-        battery_state = cast(
-            ApplyResult[BatteryState],
-            client.get_battery_state(
-                async_req=True,
-                _request_timeout=3,
-            ),
-        ).get()
+        battery_state: BatteryState = await hass.async_add_executor_job(
+            partial(client.get_battery_state, _request_timeout=3)
+        )
     except (MaxRetryError, ServiceException):
         return False
 
@@ -167,9 +162,9 @@ async def init_entities(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     ]
 
     # Get available favourites.
-    favourites = cast(
-        ApplyResult[dict[str, Preset]], client.get_presets(async_req=True)
-    ).get()
+    favourites: dict[str, Preset] = await hass.async_add_executor_job(
+        client.get_presets
+    )
 
     # Create the favourites Button entities.
     favourite_buttons: list[BangOlufsenButtonFavourite] = []
@@ -198,9 +193,9 @@ async def init_entities(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     switches: list[BangOlufsenSwitch] = [BangOlufsenSwitchLoudness(entry)]
 
     # Create the Text entities.
-    beolink_self = cast(
-        ApplyResult[BeolinkPeer], client.get_beolink_self(async_req=True)
-    ).get()
+    beolink_self: BeolinkPeer = await hass.async_add_executor_job(
+        client.get_beolink_self
+    )
 
     texts: list[BangOlufsenText] = [
         BangOlufsenTextFriendlyName(entry, beolink_self.friendly_name),
@@ -208,10 +203,9 @@ async def init_entities(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Add the Home Control URI entity if the device supports it
     if model in SUPPORT_ENUM.HOME_CONTROL.value:
-        home_control = cast(
-            ApplyResult[HomeControlUri],
-            client.get_remote_home_control_uri(async_req=True),
-        ).get()
+        home_control: HomeControlUri = await hass.async_add_executor_job(
+            client.get_remote_home_control_uri
+        )
 
         texts.append(BangOlufsenTextHomeControlUri(entry, home_control.uri))
 
@@ -219,9 +213,7 @@ async def init_entities(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     selects: list[BangOlufsenSelect] = []
 
     # Create the listening position Select entity if supported
-    scenes = cast(
-        ApplyResult[dict[str, Scene]], client.get_all_scenes(async_req=True)
-    ).get()
+    scenes: dict[str, Scene] = await hass.async_add_executor_job(client.get_all_scenes)
 
     # Listening positions
     for scene_key in scenes:
@@ -234,15 +226,14 @@ async def init_entities(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Create the sound mode select entity if supported
     # Currently the Balance does not expose any useful Sound Modes and should be excluded
     if model != MODEL_ENUM.BEOSOUND_BALANCE:
-        listening_modes = cast(
-            ApplyResult[list[ListeningMode]],
-            client.get_listening_mode_set(async_req=True),
-        ).get()
+        listening_modes: list[ListeningMode] = await hass.async_add_executor_job(
+            client.get_listening_mode_set
+        )
         if len(listening_modes) > 0:
             selects.append(BangOlufsenSelectSoundMode(entry))
 
     # Create the Media Player entity.
-    media_player = BangOlufsenMediaPlayer(entry)
+    media_player = BangOlufsenMediaPlayer(entry, coordinator)
 
     # Add the created entities
     hass.data[DOMAIN][entry.unique_id] = {
@@ -1,10 +1,10 @@
 """Config flow for the Bang & Olufsen integration."""
 from __future__ import annotations
 
+from functools import partial
 import ipaddress
 import logging
-from multiprocessing.pool import ApplyResult
-from typing import Any, TypedDict, cast
+from typing import Any, TypedDict
 
 from mozart_api.exceptions import ApiException, NotFoundException
 from mozart_api.models import BeolinkPeer, VolumeSettings
@@ -120,10 +120,9 @@ class BangOlufsenConfigFlowHandler(ConfigFlow, domain=DOMAIN):
             self._client = MozartClient(self._host, urllib3_logging_level=logging.ERROR)
 
         # Get current volume settings
-        volume_settings = cast(
-            ApplyResult[VolumeSettings],
-            self._client.get_volume_settings(async_req=True),
-        ).get()
+        volume_settings: VolumeSettings = await self.hass.async_add_executor_job(
+            self._client.get_volume_settings
+        )
 
         # Create a dict containing all necessary information for setup
         data = UserInput()
@@ -164,10 +163,9 @@ class BangOlufsenConfigFlowHandler(ConfigFlow, domain=DOMAIN):
 
             # Try to get information from Beolink self method.
             try:
-                beolink_self = cast(
-                    ApplyResult[BeolinkPeer],
-                    self._client.get_beolink_self(async_req=True, _request_timeout=3),
-                ).get()
+                beolink_self: BeolinkPeer = await self.hass.async_add_executor_job(
+                    partial(self._client.get_beolink_self, _request_timeout=3)
+                )
 
             except (
                 ApiException,
@@ -281,10 +279,9 @@ class BangOlufsenOptionsFlowHandler(OptionsFlow):
 
         # Create data schema with the current volume options, not necessarily the ones set in Home Assistant.
         # Also add the ability to change the friendly name in Home Assistant
-        volume_settings = cast(
-            ApplyResult[VolumeSettings],
-            self._client.get_volume_settings(async_req=True),
-        ).get()
+        volume_settings: VolumeSettings = await self.hass.async_add_executor_job(
+            self._client.get_volume_settings
+        )
 
         data_schema = {
             vol.Optional(CONF_NAME, default=self._config_entry.title): cv.string
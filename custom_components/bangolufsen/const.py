@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from enum import Enum, StrEnum
+from functools import lru_cache
 import logging
 from typing import Final, cast
 
@@ -27,7 +28,7 @@ from mozart_api.models import (
     VolumeState,
     WebsocketNotificationTag,
 )
-from mozart_api.mozart_client import MozartClient
+from mozart_api.mozart_client import MozartClient, check_valid_jid as check_jid
 
 from homeassistant.components.media_player import MediaPlayerState, MediaType
 from homeassistant.config_entries import ConfigEntry
@@ -239,19 +240,21 @@ PLAYING: Final[tuple] = ("started", "buffering", BANGOLUFSEN_ON)
 NOT_PLAYING: Final[tuple] = ("idle", "paused", "stopped", "ended", "unknown", "error")
 
 # Sources on the device that should not be selectable by the user
-HIDDEN_SOURCE_IDS: Final[tuple] = (
-    "airPlay",
-    "bluetooth",
-    "chromeCast",
-    "generator",
-    "local",
-    "dlna",
-    "qplay",
-    "wpl",
-    "pl",
-    "beolink",
-    "classicsAdapter",
-    "usbIn",
+HIDDEN_SOURCE_IDS: Final[frozenset] = frozenset(
+    (
+        "airPlay",
+        "bluetooth",
+        "chromeCast",
+        "generator",
+        "local",
+        "dlna",
+        "qplay",
+        "wpl",
+        "pl",
+        "beolink",
+        "classicsAdapter",
+        "usbIn",
+    )
 )
 
 # Fallback sources to use in case of API failure.
@@ -370,6 +373,13 @@ ACCEPTED_COMMANDS_LISTS: Final[tuple] = (
     NONE_PARAMETERS,
 )
 
+# Dict of all commands and their parameter types for looking up commands.
+ACCEPTED_COMMANDS_TYPES: Final[dict[str, type | None]] = {
+    command: command_list[-1]
+    for command_list in ACCEPTED_COMMANDS_LISTS
+    for command in command_list[:-1]
+}
+
 
 def get_device(hass: HomeAssistant | None, unique_id: str) -> DeviceEntry | None:
     """Get the device."""
@@ -381,6 +391,12 @@ def get_device(hass: HomeAssistant | None, unique_id: str) -> DeviceEntry | None
     return device
 
 
+@lru_cache(maxsize=256)
+def check_valid_jid(jid: str) -> bool:
+    """Check if a Beolink JID is valid. The result is cached as JIDs are stable."""
+    return check_jid(jid)
+
+
 def generate_favourite_attributes(
     favourite: Preset,
 ) -> dict[str, str | int | dict[str, str | bool]]:
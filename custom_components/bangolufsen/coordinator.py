@@ -3,10 +3,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta
+from functools import partial
 import logging
-from multiprocessing.pool import ApplyResult
-from typing import TypedDict, cast
+from typing import TypedDict
 
 from mozart_api.exceptions import ApiException
 from mozart_api.models import (
@@ -17,6 +18,7 @@ from mozart_api.models import (
     PlaybackContentMetadata,
     PlaybackError,
     PlaybackProgress,
+    PlayQueueSettings,
     Preset,
     RenderingState,
     SoftwareUpdateState,
@@ -36,6 +38,7 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.dt import utcnow
 
 from .const import (
     BANGOLUFSEN_EVENT,
@@ -48,11 +51,25 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# The queue settings are polled every two minutes, i.e. every other update.
+# Slightly less to allow for timing variations between the updates.
+_QUEUE_SETTINGS_INTERVAL = timedelta(seconds=110)
+
+# Exceptions raised by the API when the device is not available.
+_CONNECTION_ERRORS = (
+    MaxRetryError,
+    NewConnectionError,
+    ApiException,
+    ConnectionResetError,
+    AttributeError,  # An API bug will return an invalid value when the device is not available
+)
+
 
 class CoordinatorData(TypedDict):
     """TypedDict for coordinator data."""
 
     favourites: dict[str, Preset]
+    queue_settings: PlayQueueSettings
 
 
 class BangOlufsenCoordinator(DataUpdateCoordinator, BangOlufsenVariables):
@@ -69,9 +86,13 @@ class BangOlufsenCoordinator(DataUpdateCoordinator, BangOlufsenVariables):
         )
         BangOlufsenVariables.__init__(self, entry)
 
-        self._coordinator_data: CoordinatorData = {"favourites": {}}
+        self._coordinator_data: CoordinatorData = {
+            "favourites": {},
+            "queue_settings": PlayQueueSettings(),
+        }
 
         self._device: DeviceEntry | None = None
+        self._queue_settings_updated: datetime | None = None
 
         # WebSocket callbacks
         self._client.get_on_connection(self.on_connection)
@@ -112,13 +133,48 @@ class BangOlufsenCoordinator(DataUpdateCoordinator, BangOlufsenVariables):
         # Used for firing events and debugging
         self._client.get_all_notifications_raw(self.on_all_notifications_raw)
 
+    async def _get_queue_settings(self) -> PlayQueueSettings:
+        """Get the queue settings. Keep the last known settings if unavailable."""
+        try:
+            queue_settings: PlayQueueSettings = await self.hass.async_add_executor_job(
+                partial(self._client.get_settings_queue, _request_timeout=5)
+            )
+        except _CONNECTION_ERRORS:
+            _LOGGER.debug("Unable to get the queue settings of %s", self._name)
+            return self._coordinator_data["queue_settings"]
+
+        self._queue_settings_updated = utcnow()
+        return queue_settings
+
+    async def async_update_queue_settings(self) -> None:
+        """Update only the queue settings outside of the regular polling."""
+        self.data["queue_settings"] = await self._get_queue_settings()
+
+        self.async_update_listeners()
+
     async def _update_variables(self) -> None:
         """Update the coordinator data."""
-        favourites = cast(
-            ApplyResult[dict[str, Preset]],
-            self._client.get_presets(async_req=True, _request_timeout=5),
-        ).get()
-        self._coordinator_data = {"favourites": favourites}
+        queue_settings = self._coordinator_data["queue_settings"]
+
+        if (
+            self._queue_settings_updated is None
+            or utcnow() - self._queue_settings_updated >= _QUEUE_SETTINGS_INTERVAL
+        ):
+            favourites, queue_settings = await asyncio.gather(
+                self.hass.async_add_executor_job(
+                    partial(self._client.get_presets, _request_timeout=5)
+                ),
+                self._get_queue_settings(),
+            )
+        else:
+            favourites = await self.hass.async_add_executor_job(
+                partial(self._client.get_presets, _request_timeout=5)
+            )
+
+        self._coordinator_data = {
+            "favourites": favourites,
+            "queue_settings": queue_settings,
+        }
 
     async def _async_update_data(self) -> CoordinatorData:
         """Get all information needed by the polling entities."""
@@ -130,13 +186,7 @@ class BangOlufsenCoordinator(DataUpdateCoordinator, BangOlufsenVariables):
             await self._update_variables()
             return self._coordinator_data
 
-        except (
-            MaxRetryError,
-            NewConnectionError,
-            ApiException,
-            ConnectionResetError,
-            AttributeError,  # An API bug will return an invalid value when the device is not available
-        ):
+        except _CONNECTION_ERRORS:
             raise UpdateFailed
 
     def connect_websocket(self, _: datetime | None = None) -> None:
@@ -333,11 +383,8 @@ class BangOlufsenCoordinator(DataUpdateCoordinator, BangOlufsenVariables):
     def on_software_update_state(self, notification: SoftwareUpdateState) -> None:
         """Check device sw version."""
 
-        # Get software version.
-        software_status = cast(
-            ApplyResult[SoftwareUpdateStatus],
-            self._client.get_softwareupdate_status(async_req=True),
-        ).get()
+        # Get software version. This is already running in the WebSocket listener thread.
+        software_status: SoftwareUpdateStatus = self._client.get_softwareupdate_status()
 
         # Update the HA device if the sw version does not match
         if not isinstance(self._device, DeviceEntry):
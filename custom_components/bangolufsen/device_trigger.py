@@ -1,7 +1,6 @@
 """Device triggers for the Bang & Olufsen integration."""
 from __future__ import annotations
 
-from multiprocessing.pool import ApplyResult
 from typing import Any, cast
 
 from mozart_api.models import PairedRemote, PairedRemoteResponse
@@ -157,9 +156,9 @@ async def async_get_triggers(
     client = MozartClient(host=media_player.entry.data[CONF_HOST])
 
     # Get if a remote control is connected
-    bluetooth_remote_list = cast(
-        ApplyResult[PairedRemoteResponse], client.get_bluetooth_remotes(async_req=True)
-    ).get()
+    bluetooth_remote_list: PairedRemoteResponse = await hass.async_add_executor_job(
+        client.get_bluetooth_remotes
+    )
     remote_control_available = bool(
         len(cast(list[PairedRemote], bluetooth_remote_list.items))
     )
@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta
+from collections.abc import Callable, Coroutine
+from datetime import datetime
+from functools import partial
 import json
 import logging
-from multiprocessing.pool import ApplyResult
+import re
 from typing import Any, cast
 
 from mozart_api import __version__ as MOZART_API_VERSION
@@ -43,7 +45,6 @@ from mozart_api.models import (
     VolumeSettings,
     VolumeState,
 )
-from mozart_api.mozart_client import check_valid_jid
 import voluptuous as vol
 
 from homeassistant.components import media_source
@@ -60,8 +61,9 @@ from homeassistant.components.media_player import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_MODEL, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
@@ -72,11 +74,12 @@ from homeassistant.helpers.entity_platform import (
     async_get_current_platform,
 )
 from homeassistant.helpers.entity_registry import RegistryEntry
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util.dt import utcnow
 
 from .const import (
     ACCEPTED_COMMANDS,
-    ACCEPTED_COMMANDS_LISTS,
+    ACCEPTED_COMMANDS_TYPES,
     ART_SIZE_ENUM,
     BANGOLUFSEN_MEDIA_TYPE,
     BANGOLUFSEN_STATES,
@@ -96,7 +99,9 @@ from .const import (
     SOURCE_ENUM,
     VALID_MEDIA_TYPES,
     WEBSOCKET_NOTIFICATION,
+    check_valid_jid,
 )
+from .coordinator import BangOlufsenCoordinator
 from .entity import BangOlufsenEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -123,7 +128,45 @@ BANGOLUFSEN_FEATURES = (
 
 
 PARALLEL_UPDATES = 0
-SCAN_INTERVAL = timedelta(minutes=2)
+
+# Service schemas for Beolink JIDs.
+_BEOLINK_JID_SCHEMA = vol.All(vol.Coerce(str), vol.Length(min=47, max=47))
+_BEOLINK_JIDS_SCHEMA = vol.All(cv.ensure_list, [_BEOLINK_JID_SCHEMA])
+
+# Shared placeholder for when there is no available artwork. Must not be modified.
+_EMPTY_ART = Art()
+
+# Sources that are identified by the playback metadata title.
+_METADATA_TITLE_SOURCES = frozenset((SOURCE_ENUM.lineIn, SOURCE_ENUM.bluetooth))
+
+# Sources that may send stale metadata through the WebSocket.
+_STALE_METADATA_SOURCES = frozenset(
+    (SOURCE_ENUM.bluetooth, SOURCE_ENUM.lineIn, SOURCE_ENUM.spdif)
+)
+
+# Sources where a remote leader in the WebSocket metadata is stale.
+_NO_REMOTE_LEADER_SOURCES = frozenset((SOURCE_ENUM.lineIn, SOURCE_ENUM.uriStreamer))
+
+# Translation between device and Home Assistant repeat settings.
+_REPEAT_TO_HA: dict[str, RepeatMode] = {
+    member: cast(RepeatMode, member.name) for member in REPEAT_ENUM
+}
+_HA_TO_REPEAT: dict[str, REPEAT_ENUM] = {
+    repeat: member for member, repeat in _REPEAT_TO_HA.items()
+}
+
+# Deezer URIs that should be played as a playlist.
+_DEEZER_COLLECTION_RE = re.compile("playlist|album")
+
+# Constants compared against on every media command.
+_MEDIA_TYPE_DEEZER = BANGOLUFSEN_MEDIA_TYPE.DEEZER
+_MEDIA_TYPE_FAVOURITE = BANGOLUFSEN_MEDIA_TYPE.FAVOURITE
+_MEDIA_TYPE_RADIO = BANGOLUFSEN_MEDIA_TYPE.RADIO
+_MEDIA_TYPE_TTS = BANGOLUFSEN_MEDIA_TYPE.TTS
+_SOURCE_DEEZER = SOURCE_ENUM.deezer
+
+# Valid media types for checking membership. The tuple is kept for logging.
+_VALID_MEDIA_TYPES_SET = frozenset(VALID_MEDIA_TYPES)
 
 
 async def async_setup_entry(
@@ -134,7 +177,7 @@ async def async_setup_entry(
     """Set up a Media Player entity from config entry."""
     entity = hass.data[DOMAIN][config_entry.unique_id][ENTITY_ENUM.MEDIA_PLAYER]
     # Add MediaPlayer entity
-    async_add_entities(new_entities=[entity], update_before_add=True)
+    async_add_entities(new_entities=[entity])
 
     # Register services.
     platform = async_get_current_platform()
@@ -142,43 +185,20 @@ async def async_setup_entry(
     platform.async_register_entity_service(
         name="beolink_join",
         schema={
-            vol.Optional("beolink_jid"): vol.All(
-                vol.Coerce(type=cv.string),
-                vol.Length(min=47, max=47),
-            ),
+            vol.Optional("beolink_jid"): _BEOLINK_JID_SCHEMA,
         },
         func="async_beolink_join",
     )
 
     platform.async_register_entity_service(
         name="beolink_expand",
-        schema={
-            vol.Required("beolink_jids"): vol.All(
-                cv.ensure_list,
-                [
-                    vol.All(
-                        vol.Coerce(type=cv.string),
-                        vol.Length(min=47, max=47),
-                    )
-                ],
-            )
-        },
+        schema={vol.Required("beolink_jids"): _BEOLINK_JIDS_SCHEMA},
         func="async_beolink_expand",
     )
 
     platform.async_register_entity_service(
         name="beolink_unexpand",
-        schema={
-            vol.Required("beolink_jids"): vol.All(
-                cv.ensure_list,
-                [
-                    vol.All(
-                        vol.Coerce(type=cv.string),
-                        vol.Length(min=47, max=47),
-                    )
-                ],
-            )
-        },
+        schema={vol.Required("beolink_jids"): _BEOLINK_JIDS_SCHEMA},
         func="async_beolink_unexpand",
     )
 
@@ -234,16 +254,24 @@ async def async_setup_entry(
     )
 
 
-class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
+class BangOlufsenMediaPlayer(CoordinatorEntity, MediaPlayerEntity, BangOlufsenEntity):
     """Representation of a media player."""
 
     _attr_has_entity_name = False
     _attr_icon = "mdi:speaker-wireless"
     _attr_supported_features = BANGOLUFSEN_FEATURES
 
-    def __init__(self, entry: ConfigEntry) -> None:
+    # The command used for toggling play/pause in each state.
+    _PLAY_PAUSE_DISPATCH: dict[str, str] = {
+        MediaPlayerState.PLAYING: "async_media_pause",
+        MediaPlayerState.PAUSED: "async_media_play",
+        MediaPlayerState.IDLE: "async_media_play",
+    }
+
+    def __init__(self, entry: ConfigEntry, coordinator: BangOlufsenCoordinator) -> None:
         """Initialize the media player."""
-        super().__init__(entry)
+        CoordinatorEntity.__init__(self, coordinator)
+        BangOlufsenEntity.__init__(self, entry)
 
         self._beolink_jid: str = self.entry.data[CONF_BEOLINK_JID]
         self._default_volume: int = self.entry.data[CONF_DEFAULT_VOLUME]
@@ -261,126 +289,191 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
         )
         self._attr_group_members = []
         self._attr_name = self._name
-        self._attr_should_poll = True
         self._attr_unique_id = self._unique_id
 
         # Misc. variables.
+        self._audio_source_names: set[str] = set()
         self._audio_sources: dict[str, str] = {}
         self._beolink_listeners: list[BeolinkListener] = []
+        self._beolink_listener_signals: list[str] = []
         self._friendly_name: str = ""
-        self._last_update: datetime = datetime(1970, 1, 1, 0, 0, 0, 0)
-        self._media_image: Art = Art()
-        self._queue_settings: PlayQueueSettings = PlayQueueSettings()
+        self._jid_to_entity_id: dict[str, str | None] = {}
+        self._last_update: datetime | None = None
+        self._media_image: Art = _EMPTY_ART
         self._remote_leader: BeolinkLeader | None = None
+        self._remote_leader_key: tuple[str | None, str | None] | None = None
+        self._remote_leader_signals: dict[str, str] = {}
         self._software_status: SoftwareUpdateStatus = SoftwareUpdateStatus(
             software_version="",
             state=SoftwareUpdateState(seconds_remaining=0, value="idle"),
         )
+        self._source_ids: dict[str, str] = {}
+        self._source_names: tuple[str, ...] = ()
         self._sources: dict[str, str] = {}
         self._state: str = MediaPlayerState.IDLE
         self._video_sources: dict[str, str] = {}
+        self._write_state_handle: asyncio.Handle | None = None
+        self._initialized: bool = False
+        self._pending_notifications: dict[str, tuple[Any, ...]] = {}
+        self._beolink_debouncer: Debouncer | None = None
+        self._beolink_refresh_requested: bool = False
+        self._pending_volume: int | None = None
+        self._volume_debouncer: Debouncer | None = None
 
         # Extra state attributes.
         self._beolink_attribute: dict[str, dict] | None = None
         self._bluetooth_attribute: dict[str, dict] | None = None
 
+        # Dispatcher signals and their targets. The signals are only generated once.
+        notification_targets: dict[str, Callable[..., Coroutine]] = {
+            WEBSOCKET_NOTIFICATION.PLAYBACK_METADATA: self._update_playback_metadata,
+            WEBSOCKET_NOTIFICATION.PLAYBACK_ERROR: self._update_playback_error,
+            WEBSOCKET_NOTIFICATION.PLAYBACK_PROGRESS: self._update_playback_progress,
+            WEBSOCKET_NOTIFICATION.PLAYBACK_STATE: self._update_playback_state,
+            WEBSOCKET_NOTIFICATION.SOURCE_CHANGE: self._update_source_change,
+            WEBSOCKET_NOTIFICATION.VOLUME: self._update_volume,
+            WEBSOCKET_NOTIFICATION.REMOTE_MENU_CHANGED: self._update_sources,
+            WEBSOCKET_NOTIFICATION.CONFIGURATION: self._update_friendly_name,
+            WEBSOCKET_NOTIFICATION.BLUETOOTH_DEVICES: self._update_bluetooth,
+            WEBSOCKET_NOTIFICATION.BEOLINK: self._request_beolink_refresh,
+        }
+        beolink_targets: dict[str, Callable[..., Coroutine]] = {
+            BEOLINK_LEADER_COMMAND: self.async_beolink_leader_command,
+            BEOLINK_LISTENER_COMMAND: self.async_beolink_listener_command,
+            BEOLINK_VOLUME: self.async_beolink_set_volume,
+            BEOLINK_RELATIVE_VOLUME: self.async_beolink_set_relative_volume,
+        }
+        self._notification_targets: dict[str, Callable[..., Coroutine]] = {
+            f"{self._unique_id}_{notification}": target
+            for notification, target in notification_targets.items()
+        }
+        self._beolink_targets: dict[str, Callable[..., Coroutine]] = {
+            f"{self._beolink_jid}_{command}": target
+            for command, target in beolink_targets.items()
+        }
+
     async def async_added_to_hass(self) -> None:
-        """Turn on the dispatchers."""
+        """Turn on the dispatchers and initialize the entity."""
+        await super().async_added_to_hass()
 
-        await self._initialize()
+        # Collapse bursts of playback metadata notifications into as few Beolink updates as possible.
+        self._beolink_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=0.05,
+            immediate=True,
+            function=self._refresh_beolink,
+        )
 
-        await super().async_added_to_hass()
+        # Only send the latest of rapidly changing volume levels, e.g. from a slider.
+        self._volume_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=0.05,
+            immediate=True,
+            function=self._send_volume_level,
+        )
+
+        # Connect the dispatchers first to avoid missing notifications during initialization.
         self._dispatchers.extend(
             [
                 async_dispatcher_connect(
                     self.hass,
-                    f"{self._unique_id}_{WEBSOCKET_NOTIFICATION.PLAYBACK_METADATA}",
-                    self._update_playback_metadata,
-                ),
-                async_dispatcher_connect(
-                    self.hass,
-                    f"{self._unique_id}_{WEBSOCKET_NOTIFICATION.PLAYBACK_ERROR}",
-                    self._update_playback_error,
-                ),
-                async_dispatcher_connect(
-                    self.hass,
-                    f"{self._unique_id}_{WEBSOCKET_NOTIFICATION.PLAYBACK_PROGRESS}",
-                    self._update_playback_progress,
-                ),
-                async_dispatcher_connect(
-                    self.hass,
-                    f"{self._unique_id}_{WEBSOCKET_NOTIFICATION.PLAYBACK_STATE}",
-                    self._update_playback_state,
-                ),
-                async_dispatcher_connect(
-                    self.hass,
-                    f"{self._unique_id}_{WEBSOCKET_NOTIFICATION.SOURCE_CHANGE}",
-                    self._update_source_change,
-                ),
-                async_dispatcher_connect(
-                    self.hass,
-                    f"{self._unique_id}_{WEBSOCKET_NOTIFICATION.VOLUME}",
-                    self._update_volume,
-                ),
-                async_dispatcher_connect(
-                    self.hass,
-                    f"{self._unique_id}_{WEBSOCKET_NOTIFICATION.REMOTE_MENU_CHANGED}",
-                    self._update_sources,
-                ),
-                async_dispatcher_connect(
-                    self.hass,
-                    f"{self._unique_id}_{WEBSOCKET_NOTIFICATION.CONFIGURATION}",
-                    self._update_friendly_name,
-                ),
-                async_dispatcher_connect(
-                    self.hass,
-                    f"{self._unique_id}_{WEBSOCKET_NOTIFICATION.BLUETOOTH_DEVICES}",
-                    self._update_bluetooth,
-                ),
-                async_dispatcher_connect(
-                    self.hass,
-                    f"{self._unique_id}_{WEBSOCKET_NOTIFICATION.BEOLINK}",
-                    self._update_beolink,
-                ),
-                async_dispatcher_connect(
-                    self.hass,
-                    f"{self._beolink_jid}_{BEOLINK_LEADER_COMMAND}",
-                    self.async_beolink_leader_command,
-                ),
-                async_dispatcher_connect(
-                    self.hass,
-                    f"{self._beolink_jid}_{BEOLINK_LISTENER_COMMAND}",
-                    self.async_beolink_listener_command,
-                ),
-                async_dispatcher_connect(
-                    self.hass,
-                    f"{self._beolink_jid}_{BEOLINK_VOLUME}",
-                    self.async_beolink_set_volume,
-                ),
-                async_dispatcher_connect(
-                    self.hass,
-                    f"{self._beolink_jid}_{BEOLINK_RELATIVE_VOLUME}",
-                    self.async_beolink_set_relative_volume,
-                ),
+                    signal,
+                    partial(self._async_dispatch_notification, signal),
+                )
+                for signal in self._notification_targets
+            ]
+        )
+        self._dispatchers.extend(
+            [
+                async_dispatcher_connect(self.hass, signal, target)
+                for signal, target in self._beolink_targets.items()
             ]
         )
+        self._dispatchers.append(
+            self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._invalidate_jid_cache
+            )
+        )
+
+        try:
+            await self._initialize()
+
+            # Apply the latest notification of each type received during initialization.
+            # Keep buffering until done to avoid applying older notifications after newer ones.
+            while self._pending_notifications:
+                signal = next(iter(self._pending_notifications))
+                args = self._pending_notifications.pop(signal)
+
+                await self._notification_targets[signal](*args)
+
+        # Home Assistant does not remove an entity that failed to be added, so unsubscribe here.
+        except BaseException:
+            await self.async_will_remove_from_hass()
+            self._dispatchers = []
+            self._call_on_remove_callbacks()
+            raise
 
-    async def async_update(self) -> None:
-        """Update polling information."""
-        if self._attr_available:
-            self._queue_settings = cast(
-                ApplyResult[PlayQueueSettings],
-                self._client.get_settings_queue(async_req=True, _request_timeout=5),
-            ).get()
+        self._initialized = True
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Turn off the dispatchers and cancel any scheduled updates."""
+        await super().async_will_remove_from_hass()
+
+        # The entity is initialized again if it is added again, e.g. when renamed.
+        self._initialized = False
+        self._pending_notifications = {}
+
+        if self._beolink_debouncer is not None:
+            self._beolink_debouncer.async_cancel()
+
+        if self._volume_debouncer is not None:
+            self._volume_debouncer.async_cancel()
+
+        if self._write_state_handle is not None:
+            self._write_state_handle.cancel()
+            self._write_state_handle = None
+
+    async def _async_dispatch_notification(self, signal: str, *args: Any) -> None:
+        """Handle a notification. Only keep the latest of each type until initialized."""
+        if not self._initialized:
+            self._pending_notifications[signal] = args
+            return
+
+        await self._notification_targets[signal](*args)
+
+    @callback
+    def _schedule_write_state(self) -> None:
+        """Write the state once for all updates received in the same event loop iteration."""
+        if self._write_state_handle is not None:
+            return
+
+        self._write_state_handle = self.hass.loop.call_soon(self._write_state)
+
+    @callback
+    def _write_state(self) -> None:
+        """Write the scheduled state."""
+        self._write_state_handle = None
+        self.async_write_ha_state()
 
     async def _initialize(self) -> None:
         """Initialize connection dependent variables."""
 
-        # Get software version.
-        self._software_status = cast(
-            ApplyResult[SoftwareUpdateStatus],
-            self._client.get_softwareupdate_status(async_req=True),
-        ).get()
+        # Get the software version, device friendly name and overall device state concurrently.
+        # The device state is handled by WebSocket events the rest of the time.
+        beolink_self: BeolinkPeer
+        product_state: ProductState
+
+        (
+            self._software_status,
+            beolink_self,
+            product_state,
+        ) = await asyncio.gather(
+            self.hass.async_add_executor_job(self._client.get_softwareupdate_status),
+            self.hass.async_add_executor_job(self._client.get_beolink_self),
+            self.hass.async_add_executor_job(self._client.get_product_state),
+        )
 
         _LOGGER.debug(
             "Connected to: %s %s running SW %s",
@@ -389,10 +482,6 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
             self._software_status.software_version,
         )
 
-        # Get the device friendly name
-        beolink_self = cast(
-            ApplyResult[BeolinkPeer], self._client.get_beolink_self(async_req=True)
-        ).get()
         self._friendly_name = beolink_self.friendly_name
 
         # Set the default and maximum volume of the product.
@@ -404,11 +493,6 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
             async_req=True,
         )
 
-        # Get overall device state once. This is handled by WebSocket events the rest of the time.
-        product_state = cast(
-            ApplyResult[ProductState], self._client.get_product_state(async_req=True)
-        ).get()
-
         # Get volume information.
         if product_state.volume:
             self._volume = product_state.volume
@@ -434,14 +518,14 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
         # Get the highest resolution available of the given images.
         self._update_artwork()
 
-        # If the device has been updated with new sources, then the API will fail here.
-        await self._update_sources()
-
-        # Update beolink listener / leader attributes.
-        await self._update_beolink()
-
-        # Get paired remotes and bluetooth devices
-        await self._update_bluetooth()
+        # Update sources, Beolink listener / leader attributes, paired remotes and bluetooth devices
+        # concurrently. If the device has been updated with new sources,
+        # then the API will fail when getting the sources.
+        await asyncio.gather(
+            self._update_sources(),
+            self._update_beolink(),
+            self._update_bluetooth(),
+        )
 
         # Set the static entity attributes that needed more information.
         self._attr_source_list = list(self._sources.values())
@@ -449,7 +533,7 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
     async def _update_friendly_name(self, name: str) -> None:
         """Update the device friendly name."""
         self._friendly_name = name
-        await self._update_beolink()
+        await self._request_beolink_refresh()
 
     async def _update_sources(self) -> None:
         """Get sources for the specific product."""
@@ -457,10 +541,9 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
         # Audio sources
         try:
             # Get all available sources.
-            sources = cast(
-                ApplyResult[SourceArray],
-                self._client.get_available_sources(target_remote=False, async_req=True),
-            ).get()
+            sources: SourceArray = await self.hass.async_add_executor_job(
+                partial(self._client.get_available_sources, target_remote=False)
+            )
 
         # Use a fallback list of sources
         except ValueError:
@@ -479,47 +562,58 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
 
         # Save all of the relevant enabled sources, both the ID and the friendly name for displaying in a dict.
         self._audio_sources = {
-            source.id: source.name
+            source_id: source.name
             for source in cast(list[Source], sources.items)
             if source.is_enabled
-            and source.id
+            and (source_id := source.id)
             and source.name
-            and source.id not in HIDDEN_SOURCE_IDS
+            and source_id not in HIDDEN_SOURCE_IDS
         }
 
         # Video sources from remote menu
-        menu_items = cast(
-            ApplyResult[dict[str, RemoteMenuItem]],
-            self._client.get_remote_menu(async_req=True),
-        ).get()
+        menu_items: dict[str, RemoteMenuItem] = await self.hass.async_add_executor_job(
+            self._client.get_remote_menu
+        )
 
-        for key in menu_items:
-            menu_item = menu_items[key]
+        # Combine the audio and video sources while finding the video sources.
+        self._sources = dict(self._audio_sources)
+        self._video_sources = {}
 
+        for key, menu_item in menu_items.items():
             if not menu_item.available:
                 continue
 
+            content = menu_item.content
+            label = menu_item.label
+
             # TV SOURCES
             if (
-                menu_item.content is not None
-                and menu_item.content.categories
-                and len(menu_item.content.categories) > 0
-                and "music" not in menu_item.content.categories
-                and menu_item.label
-                and menu_item.label != "TV"
+                content is not None
+                and content.categories
+                and "music" not in content.categories
+                and label
+                and label != "TV"
             ):
-                self._video_sources[key] = menu_item.label
+                self._video_sources[key] = label
+                self._sources[key] = label
 
-        # Combine the source dicts
-        self._sources = self._audio_sources | self._video_sources
+        # Reverse lookups for source selection. The first ID wins for duplicate names.
+        self._source_ids = {
+            name: source_id for source_id, name in reversed(self._sources.items())
+        }
+        self._audio_source_names = set(self._audio_sources.values())
+        self._source_names = tuple(self._sources.values())
 
         # HASS won't necessarily be running the first time this method is run
         if self.hass.is_running:
-            self.async_write_ha_state()
+            self._schedule_write_state()
 
-    def _get_beolink_jid(self, entity_id: str) -> str | None:
+    def _get_beolink_jid(
+        self, entity_id: str, entity_registry: er.EntityRegistry | None = None
+    ) -> str | None:
         """Get beolink JID from entity_id."""
-        entity_registry = er.async_get(self.hass)
+        if entity_registry is None:
+            entity_registry = er.async_get(self.hass)
 
         # Make mypy happy
         entity_entry = cast(RegistryEntry, entity_registry.async_get(entity_id))
@@ -537,159 +631,190 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
 
         return jid
 
-    def _get_entity_id_from_jid(self, jid: str) -> str | None:
+    def _get_entity_id_from_jid(
+        self, jid: str, entity_registry: er.EntityRegistry | None = None
+    ) -> str | None:
         """Get entity_id from Beolink JID (if available)."""
+        if jid in self._jid_to_entity_id:
+            return self._jid_to_entity_id[jid]
 
         unique_id = jid.split(".")[2].split("@")[0]
 
-        entity_registry = er.async_get(self.hass)
+        if entity_registry is None:
+            entity_registry = er.async_get(self.hass)
         entity_id = entity_registry.async_get_entity_id(
             Platform.MEDIA_PLAYER, DOMAIN, unique_id
         )
 
+        self._jid_to_entity_id[jid] = entity_id
         return entity_id
 
+    @callback
+    def _invalidate_jid_cache(self, _: Event) -> None:
+        """Clear the cached entity_ids when the entity registry changes."""
+        self._jid_to_entity_id.clear()
+
     def _update_artwork(self) -> None:
         """Find the highest resolution image."""
         # Ensure that the metadata doesn't change mid processing.
         metadata = self._playback_metadata
 
-        # Check if the metadata is not null and that there is art.
-        if (
-            isinstance(metadata, PlaybackContentMetadata)
-            and isinstance(metadata.art, list)
-            and len(metadata.art) > 0
-        ):
-            images = []
-            # Images either have a key for specifying resolution or a "size" for the image.
-            for image in metadata.art:
-                # Netradio.
-                if metadata.art[0].key is not None:
-                    images.append(int(image.key.split("x")[0]))
-                # Everything else.
-                elif metadata.art[0].size is not None:
-                    images.append(ART_SIZE_ENUM[image.size].value)
-
-            # Choose the largest image.
-            self._media_image = metadata.art[images.index(max(images))]
-
         # Don't leave stale image metadata if there is no available artwork.
+        if not isinstance(metadata, PlaybackContentMetadata) or not metadata.art:
+            self._media_image = _EMPTY_ART
+            return
+
+        if len(metadata.art) == 1:
+            self._media_image = metadata.art[0]
+
+        # Images either have a key for specifying resolution or a "size" for the image.
+        # Netradio.
+        elif metadata.art[0].key is not None:
+            self._media_image = max(
+                metadata.art, key=lambda image: int(image.key.split("x", 1)[0])
+            )
+
+        # Everything else.
+        elif metadata.art[0].size is not None:
+            self._media_image = max(
+                metadata.art, key=lambda image: ART_SIZE_ENUM[image.size].value
+            )
+
         else:
-            self._media_image = Art()
+            self._media_image = metadata.art[0]
 
     async def _update_beolink(self) -> None:
         """Update the current Beolink leader or Beolink listeners."""
-
-        self._beolink_attribute = {}
+        # Collect everything in locals and assign after the last request,
+        # to avoid writing partial Beolink information to the state in between.
 
         # Add Beolink JID
-        self._beolink_attribute = {
-            "beolink": {"self": {self._friendly_name: self._beolink_jid}}
-        }
+        beolink: dict[str, dict] = {"self": {self._friendly_name: self._beolink_jid}}
 
-        peers = cast(
-            ApplyResult[list[BeolinkPeer]],
-            self._client.get_beolink_peers(async_req=True),
-        ).get()
+        peers: list[BeolinkPeer] = await self.hass.async_add_executor_job(
+            self._client.get_beolink_peers
+        )
 
         if len(peers) > 0:
-            self._beolink_attribute["beolink"]["peers"] = {}
-            for peer in peers:
-                self._beolink_attribute["beolink"]["peers"][
-                    peer.friendly_name
-                ] = peer.jid
+            beolink["peers"] = {peer.friendly_name: peer.jid for peer in peers}
 
-        self._remote_leader = self._playback_metadata.remote_leader
+        remote_leader = self._playback_metadata.remote_leader
+        remote_leader_key = self._get_remote_leader_key()
 
         # Temp fix for mismatch in WebSocket metadata and "real" REST endpoint where the remote leader is not deleted.
-        if self.source in (
-            SOURCE_ENUM.lineIn,
-            SOURCE_ENUM.uriStreamer,
-        ):
-            self._remote_leader = None
+        if self.source in _NO_REMOTE_LEADER_SOURCES:
+            remote_leader = None
+
+        # If not listener, get the listeners to check if leader.
+        beolink_listeners = self._beolink_listeners
+
+        if remote_leader is None:
+            beolink_listeners = await self.hass.async_add_executor_job(
+                self._client.get_beolink_listeners
+            )
 
         # Create group members list
         group_members = []
+        entity_registry = er.async_get(self.hass)
 
         # If the device is a listener.
-        if self._remote_leader is not None:
+        if remote_leader is not None:
             # Add leader
             group_members.append(
-                cast(str, self._get_entity_id_from_jid(self._remote_leader.jid))
+                cast(
+                    str,
+                    self._get_entity_id_from_jid(remote_leader.jid, entity_registry),
+                )
             )
 
             # Add self
             group_members.append(
-                cast(str, self._get_entity_id_from_jid(self._beolink_jid))
+                cast(
+                    str,
+                    self._get_entity_id_from_jid(self._beolink_jid, entity_registry),
+                )
             )
-            self._beolink_attribute["beolink"]["leader"] = {
-                self._remote_leader.friendly_name: self._remote_leader.jid,
-            }
+            beolink["leader"] = {remote_leader.friendly_name: remote_leader.jid}
 
-        # If not listener, check if leader.
-        else:
-            self._beolink_listeners = cast(
-                ApplyResult[list[BeolinkListener]],
-                self._client.get_beolink_listeners(async_req=True),
-            ).get()
-
-            # Check if the device is a leader.
-            if len(self._beolink_listeners) > 0:
-                # Add self
-                group_members.append(
-                    cast(str, self._get_entity_id_from_jid(self._beolink_jid))
+        # Check if the device is a leader.
+        elif len(beolink_listeners) > 0:
+            # Add self
+            group_members.append(
+                cast(
+                    str,
+                    self._get_entity_id_from_jid(self._beolink_jid, entity_registry),
                 )
+            )
 
-                # Get the friendly names from listeners from the peers
-                beolink_listeners = {}
-                for beolink_listener in self._beolink_listeners:
-                    group_members.append(
-                        cast(str, self._get_entity_id_from_jid(beolink_listener.jid))
+            # Get the friendly names from listeners from the peers
+            peer_names = {peer.jid: peer.friendly_name for peer in peers}
+            listeners = {}
+            for beolink_listener in beolink_listeners:
+                group_members.append(
+                    cast(
+                        str,
+                        self._get_entity_id_from_jid(
+                            beolink_listener.jid, entity_registry
+                        ),
                     )
-                    for peer in peers:
-                        if peer.jid == beolink_listener.jid:
-                            beolink_listeners[peer.friendly_name] = beolink_listener.jid
-                            break
-
-                self._beolink_attribute["beolink"]["listeners"] = beolink_listeners
+                )
+                if beolink_listener.jid in peer_names:
+                    listeners[peer_names[beolink_listener.jid]] = beolink_listener.jid
+
+            beolink["listeners"] = listeners
+
+        self._remote_leader = remote_leader
+        self._remote_leader_key = remote_leader_key
+        self._beolink_listeners = beolink_listeners
+
+        # Get the dispatcher signals for sending commands to the remote leader or listeners.
+        self._remote_leader_signals = (
+            {
+                suffix: f"{remote_leader.jid}_{suffix}"
+                for suffix in (
+                    BEOLINK_LEADER_COMMAND,
+                    BEOLINK_RELATIVE_VOLUME,
+                    BEOLINK_VOLUME,
+                )
+            }
+            if remote_leader is not None
+            else {}
+        )
+        self._beolink_listener_signals = [
+            f"{beolink_listener.jid}_{BEOLINK_LISTENER_COMMAND}"
+            for beolink_listener in beolink_listeners
+        ]
 
+        self._beolink_attribute = {"beolink": beolink}
         self._attr_group_members = group_members
 
     async def _update_bluetooth(self) -> None:
         """Update the current bluetooth devices that are connected and paired remotes."""
-
-        self._bluetooth_attribute = {"bluetooth": {}}
+        bluetooth: dict[str, dict] = {}
 
         # Add paired remotes
-        bluetooth_remote_list = cast(
-            ApplyResult[PairedRemoteResponse],
-            self._client.get_bluetooth_remotes(async_req=True),
-        ).get()
-
-        if len(cast(list[PairedRemote], bluetooth_remote_list.items)) > 0:
-            self._bluetooth_attribute["bluetooth"]["remote"] = {}
+        bluetooth_remote_list: PairedRemoteResponse = (
+            await self.hass.async_add_executor_job(self._client.get_bluetooth_remotes)
+        )
 
-            for remote in cast(list[PairedRemote], bluetooth_remote_list.items):
-                self._bluetooth_attribute["bluetooth"]["remote"][
-                    remote.name
-                ] = remote.address
+        if remotes := cast(list[PairedRemote], bluetooth_remote_list.items):
+            bluetooth["remote"] = {remote.name: remote.address for remote in remotes}
 
         # Add currently connected bluetooth device
-        bluetooth_device_list = cast(
-            ApplyResult[BluetoothDeviceList],
-            self._client.get_bluetooth_devices_status(async_req=True),
-        ).get()
+        bluetooth_device_list: BluetoothDeviceList = (
+            await self.hass.async_add_executor_job(
+                self._client.get_bluetooth_devices_status
+            )
+        )
 
         for bluetooth_device in cast(
             list[BluetoothDevice], bluetooth_device_list.items
         ):
             if bluetooth_device.connected:
-                self._bluetooth_attribute["bluetooth"]["device"] = {
-                    bluetooth_device.name: bluetooth_device.address
-                }
+                bluetooth["device"] = {bluetooth_device.name: bluetooth_device.address}
+                break
 
-        if not self._bluetooth_attribute["bluetooth"]:
-            self._bluetooth_attribute = None
+        self._bluetooth_attribute = {"bluetooth": bluetooth} if bluetooth else None
 
     async def _update_playback_metadata(self, data: PlaybackContentMetadata) -> None:
         """Update _playback_metadata and related."""
@@ -697,9 +822,33 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
 
         # Update current artwork and remote leader.
         self._update_artwork()
-        await self._update_beolink()
 
-        self.async_write_ha_state()
+        # Only update Beolink information if the remote leader may have changed.
+        if self._get_remote_leader_key() != self._remote_leader_key:
+            await self._request_beolink_refresh()
+
+        self._schedule_write_state()
+
+    def _get_remote_leader_key(self) -> tuple[str | None, str | None]:
+        """Get the remote leader JID and source that determine the remote leader."""
+        remote_leader = self._playback_metadata.remote_leader
+
+        return (remote_leader.jid if remote_leader else None, self.source)
+
+    async def _request_beolink_refresh(self) -> None:
+        """Request a debounced update of the Beolink attributes."""
+        self._beolink_refresh_requested = True
+
+        await cast(Debouncer, self._beolink_debouncer).async_call()
+
+    async def _refresh_beolink(self) -> None:
+        """Update the Beolink attributes and write the state."""
+        # The debouncer drops calls made while an update is running, so update again if requested meanwhile.
+        while self._beolink_refresh_requested:
+            self._beolink_refresh_requested = False
+            await self._update_beolink()
+
+        self._schedule_write_state()
 
     async def _update_playback_error(self, data: PlaybackError) -> None:
         """Show playback error."""
@@ -710,7 +859,7 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
         self._playback_progress = data
         self._last_update = utcnow()
 
-        self.async_write_ha_state()
+        self._schedule_write_state()
 
     async def _update_playback_state(self, data: RenderingState) -> None:
         """Update _playback_state and related."""
@@ -720,7 +869,7 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
         if self._playback_state.value:
             self._state = self._playback_state.value
 
-            self.async_write_ha_state()
+            self._schedule_write_state()
 
     async def _update_source_change(self, data: Source) -> None:
         """Update _source_change and related."""
@@ -730,13 +879,21 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
         if self._source_change.id and self._source_change.id == SOURCE_ENUM.bluetooth:
             await self._update_bluetooth()
 
-            self.async_write_ha_state()
+        self._schedule_write_state()
+
+        # The device does not send notifications for queue settings.
+        self.hass.async_create_task(self.coordinator.async_update_queue_settings())
 
     async def _update_volume(self, data: VolumeState) -> None:
         """Update _volume."""
         self._volume = data
 
-        self.async_write_ha_state()
+        self._schedule_write_state()
+
+    @property
+    def available(self) -> bool:
+        """Return if the device is available. Follows the WebSocket connection, not the polling."""
+        return self._attr_available
 
     @property
     def state(self) -> MediaPlayerState:
@@ -746,15 +903,17 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
     @property
     def volume_level(self) -> float | None:
         """Volume level of the media player (0..1)."""
-        if self._volume.level and self._volume.level.level:
-            return float(self._volume.level.level / 100)
+        level = self._volume.level
+        if level and level.level:
+            return level.level / 100
         return None
 
     @property
     def is_volume_muted(self) -> bool | None:
         """Boolean if volume is currently muted."""
-        if self._volume.muted and self._volume.muted.muted:
-            return self._volume.muted.muted
+        muted = self._volume.muted
+        if muted:
+            return muted.muted
         return None
 
     @property
@@ -779,7 +938,7 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
         return None
 
     @property
-    def media_position_updated_at(self) -> datetime:
+    def media_position_updated_at(self) -> datetime | None:
         """Return the last time that the playback position was updated."""
         return self._last_update
 
@@ -823,67 +982,55 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
     @property
     def source(self) -> str | None:
         """Return the current audio source."""
+        # Ensure that the metadata doesn't change mid processing.
+        metadata = self._playback_metadata
 
         # Try to fix some of the source_change chromecast weirdness.
-        if hasattr(self._playback_metadata, "title"):
-            # source_change is chromecast but line in is selected.
-            if self._playback_metadata.title == SOURCE_ENUM.lineIn:
-                return SOURCE_ENUM.lineIn
-
-            # source_change is chromecast but bluetooth is selected.
-            if self._playback_metadata.title == SOURCE_ENUM.bluetooth:
-                return SOURCE_ENUM.bluetooth
-
-            # source_change is line in, bluetooth or optical but stale metadata is sent through the WebSocket,
-            # And the source has not changed.
-            if self._source_change.id in (
-                SOURCE_ENUM.bluetooth,
-                SOURCE_ENUM.lineIn,
-                SOURCE_ENUM.spdif,
-            ):
-                return SOURCE_ENUM.chromeCast
+        # source_change is chromecast but line in or bluetooth is selected.
+        if metadata.title in _METADATA_TITLE_SOURCES:
+            return metadata.title
+
+        # source_change is line in, bluetooth or optical but stale metadata is sent through the WebSocket,
+        # And the source has not changed.
+        if self._source_change.id in _STALE_METADATA_SOURCES:
+            return SOURCE_ENUM.chromeCast
 
         # source_change is chromecast and there is metadata but no artwork. Bluetooth does support metadata but not artwork
         # So i assume that it is bluetooth and not chromecast
         if (
-            hasattr(self._playback_metadata, "art")
-            and self._playback_metadata.art is not None
+            metadata.art is not None
+            and len(metadata.art) == 0
+            and self._source_change.name == SOURCE_ENUM.bluetooth
         ):
-            if (
-                len(self._playback_metadata.art) == 0
-                and self._source_change.name == SOURCE_ENUM.bluetooth
-            ):
-                return SOURCE_ENUM.bluetooth
+            return SOURCE_ENUM.bluetooth
 
         return self._source_change.name
 
     @property
     def shuffle(self) -> bool | None:
         """Return if queues should be shuffled."""
-        return self._queue_settings.shuffle
+        return self.coordinator.data["queue_settings"].shuffle
 
     @property
     def repeat(self) -> RepeatMode | None:
         """Return current repeat setting for queues."""
-        if self._queue_settings.repeat:
-            return cast(RepeatMode, REPEAT_ENUM(self._queue_settings.repeat).name)
+        queue_settings: PlayQueueSettings = self.coordinator.data["queue_settings"]
+        if queue_settings.repeat:
+            return _REPEAT_TO_HA.get(queue_settings.repeat)
         return None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return information that is not returned anywhere else."""
-        attributes: dict[str, Any] = {}
+        if self._beolink_attribute is None and self._bluetooth_attribute is None:
+            return None
 
-        if self._beolink_attribute is not None:
-            attributes.update(self._beolink_attribute)
-
-        if self._bluetooth_attribute is not None:
-            attributes.update(self._bluetooth_attribute)
+        attributes: dict[str, Any] = {
+            **(self._beolink_attribute or {}),
+            **(self._bluetooth_attribute or {}),
+        }
 
-        if attributes:
-            return attributes
-
-        return None
+        return attributes or None
 
     async def async_turn_off(self) -> None:
         """Set the device to "networkStandby"."""
@@ -891,11 +1038,14 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
 
     async def async_volume_up(self) -> None:
         """Volume up the on media player."""
-        if not self._volume.level or not self._volume.level.level:
+        level = self._volume.level
+        current_volume = level.level if level else None
+
+        if not current_volume:
             _LOGGER.warning("Error setting volume")
             return
 
-        new_volume = min(self._volume.level.level + self._volume_step, self._max_volume)
+        new_volume = min(current_volume + self._volume_step, self._max_volume)
         self._client.set_current_volume_level(
             volume_level=VolumeLevel(level=new_volume),
             async_req=True,
@@ -903,11 +1053,14 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
 
     async def async_volume_down(self) -> None:
         """Volume down the on media player."""
-        if not self._volume.level or not self._volume.level.level:
+        level = self._volume.level
+        current_volume = level.level if level else None
+
+        if not current_volume:
             _LOGGER.warning("Error setting volume")
             return
 
-        new_volume = max(self._volume.level.level - self._volume_step, 0)
+        new_volume = max(current_volume - self._volume_step, 0)
         self._client.set_current_volume_level(
             volume_level=VolumeLevel(level=new_volume),
             async_req=True,
@@ -915,10 +1068,19 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
+        self._pending_volume = int(volume * 100)
+        await cast(Debouncer, self._volume_debouncer).async_call()
+
+    async def _send_volume_level(self) -> None:
+        """Send the latest requested volume level to the device."""
+        if self._pending_volume is None:
+            return
+
         self._client.set_current_volume_level(
-            volume_level=VolumeLevel(level=int(volume * 100)),
+            volume_level=VolumeLevel(level=self._pending_volume),
             async_req=True,
         )
+        self._pending_volume = None
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute or unmute media player."""
@@ -929,10 +1091,8 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
 
     async def async_media_play_pause(self) -> None:
         """Toggle play/pause media player."""
-        if self.state == MediaPlayerState.PLAYING:
-            await self.async_media_pause()
-        elif self.state in (MediaPlayerState.PAUSED, MediaPlayerState.IDLE):
-            await self.async_media_play()
+        if (command := self._PLAY_PAUSE_DISPATCH.get(self.state)) is not None:
+            await getattr(self, command)()
 
     async def async_media_pause(self) -> None:
         """Pause media player."""
@@ -952,7 +1112,7 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
 
     async def async_media_seek(self, position: float) -> None:
         """Seek to position in ms."""
-        if self.source == SOURCE_ENUM.deezer:
+        if self.source == _SOURCE_DEEZER:
             self._client.seek_to_position(
                 position_ms=int(position * 1000), async_req=True
             )
@@ -979,31 +1139,37 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
             async_req=True,
         )
 
-        self._queue_settings.shuffle = shuffle
+        # Update the coordinator data optimistically.
+        self.coordinator.data["queue_settings"].shuffle = shuffle
+        self.coordinator.async_update_listeners()
 
     async def async_set_repeat(self, repeat: RepeatMode) -> None:
         """Set playback queues to repeat."""
+        device_repeat = _HA_TO_REPEAT[repeat]
+
         self._client.set_settings_queue(
-            play_queue_settings=PlayQueueSettings(repeat=REPEAT_ENUM[repeat]),
+            play_queue_settings=PlayQueueSettings(repeat=device_repeat),
             async_req=True,
         )
-        self._queue_settings.repeat = REPEAT_ENUM[repeat]
+
+        # Update the coordinator data optimistically.
+        self.coordinator.data["queue_settings"].repeat = device_repeat
+        self.coordinator.async_update_listeners()
 
     async def async_select_source(self, source: str) -> None:
         """Select an input source."""
-        if source not in self._sources.values():
+        key = self._source_ids.get(source)
+
+        if key is None:
             _LOGGER.error(
                 "Invalid source: %s. Valid sources are: %s",
                 source,
-                list(self._sources.values()),
+                self._source_names,
             )
             return
 
-        # pylint: disable=consider-using-dict-items
-        key = [x for x in self._sources if self._sources[x] == source][0]
-
         # Check for source type
-        if source in self._audio_sources.values():
+        if source in self._audio_source_names:
             # Audio
             self._client.set_active_source(source_id=key, async_req=True)
         else:
@@ -1019,9 +1185,11 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
             return
 
         jids = []
+        entity_registry = er.async_get(self.hass)
+
         # Get JID for each group member
         for group_member in group_members:
-            jid = self._get_beolink_jid(group_member)
+            jid = self._get_beolink_jid(group_member, entity_registry)
 
             # Invalid entity
             if jid is None:
@@ -1048,7 +1216,7 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
         if media_type.startswith("audio/"):
             media_type = MediaType.MUSIC
 
-        if media_type not in VALID_MEDIA_TYPES:
+        if media_type not in _VALID_MEDIA_TYPES_SET:
             _LOGGER.error(
                 "%s is an invalid type. Valid values are: %s",
                 media_type,
@@ -1064,15 +1232,14 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
             media_id = async_process_play_media_url(self.hass, sourced_media.url)
 
             # Remove playlist extension as it is unsupported.
-            if media_id.endswith(".m3u"):
-                media_id = media_id.replace(".m3u", "")
+            media_id = media_id.removesuffix(".m3u")
 
         if media_type in (MediaType.URL, MediaType.MUSIC):
             self._client.post_uri_source(uri=Uri(location=media_id), async_req=True)
 
         # The "provider" media_type may not be suitable for overlay all the time.
         # Use it for now.
-        elif media_type == BANGOLUFSEN_MEDIA_TYPE.TTS:
+        elif media_type == _MEDIA_TYPE_TTS:
             self._client.post_overlay_play(
                 overlay_play_request=OverlayPlayRequest(
                     uri=Uri(location=media_id),
@@ -1080,7 +1247,7 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
                 async_req=True,
             )
 
-        elif media_type == BANGOLUFSEN_MEDIA_TYPE.RADIO:
+        elif media_type == _MEDIA_TYPE_RADIO:
             self._client.run_provided_scene(
                 scene_properties=SceneProperties(
                     action_list=[
@@ -1093,10 +1260,10 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
                 async_req=True,
             )
 
-        elif media_type == BANGOLUFSEN_MEDIA_TYPE.FAVOURITE:
+        elif media_type == _MEDIA_TYPE_FAVOURITE:
             self._client.activate_preset(id=int(media_id), async_req=True)
 
-        elif media_type == BANGOLUFSEN_MEDIA_TYPE.DEEZER:
+        elif media_type == _MEDIA_TYPE_DEEZER:
             try:
                 if media_id == "flow":
                     deezer_id = None
@@ -1110,7 +1277,7 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
                     )
 
                 # Play a Deezer playlist or album.
-                elif any(match in media_id for match in ("playlist", "album")):
+                elif _DEEZER_COLLECTION_RE.search(media_id):
                     start_from = 0
                     if "start_from" in kwargs[ATTR_MEDIA_EXTRA]:
                         start_from = kwargs[ATTR_MEDIA_EXTRA]["start_from"]
@@ -1138,7 +1305,13 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
                     )
 
             except ApiException as error:
-                _LOGGER.error(json.loads(error.body)["message"])
+                # Log the message from the error body if it has one.
+                try:
+                    message = json.loads(error.body).get("message", error.body)
+                except (AttributeError, TypeError, ValueError):
+                    message = error.body
+
+                _LOGGER.error(message)
 
     async def async_browse_media(
         self,
@@ -1171,13 +1344,14 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
                 _LOGGER.error("Invalid Beolink JID: %s", beolink_jid)
                 return
 
-        self.hass.async_create_task(self._beolink_expand(beolink_jids))
+        # Stagger the requests by a second each without chaining them.
+        for delay, beolink_jid in enumerate(beolink_jids):
+            self.hass.async_create_task(self._beolink_expand(beolink_jid, delay))
 
-    async def _beolink_expand(self, beolink_jids: list[str]) -> None:
+    async def _beolink_expand(self, beolink_jid: str, delay: int) -> None:
         """Expand the Beolink experience with a non blocking delay."""
-        for beolink_jid in beolink_jids:
-            self._client.post_beolink_expand(jid=beolink_jid, async_req=True)
-            await asyncio.sleep(1)
+        await asyncio.sleep(delay)
+        self._client.post_beolink_expand(jid=beolink_jid, async_req=True)
 
     async def async_beolink_unexpand(self, beolink_jids: list[str]) -> None:
         """Unexpand a Beolink multi-room experience with a device or devices."""
@@ -1186,13 +1360,14 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
             if not check_valid_jid(beolink_jid):
                 return
 
-        self.hass.async_create_task(self._beolink_unexpand(beolink_jids))
+        # Stagger the requests by a second each without chaining them.
+        for delay, beolink_jid in enumerate(beolink_jids):
+            self.hass.async_create_task(self._beolink_unexpand(beolink_jid, delay))
 
-    async def _beolink_unexpand(self, beolink_jids: list[str]) -> None:
+    async def _beolink_unexpand(self, beolink_jid: str, delay: int) -> None:
         """Unexpand the Beolink experience with a non blocking delay."""
-        for beolink_jid in beolink_jids:
-            self._client.post_beolink_unexpand(jid=beolink_jid, async_req=True)
-            await asyncio.sleep(1)
+        await asyncio.sleep(delay)
+        self._client.post_beolink_unexpand(jid=beolink_jid, async_req=True)
 
     async def async_beolink_leave(self) -> None:
         """Leave the current Beolink experience."""
@@ -1206,54 +1381,56 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
         self, command: str, parameter: str | None = None
     ) -> None:
         """Receive a command from the Beolink leader."""
-        for command_list in ACCEPTED_COMMANDS_LISTS:
-            if command in command_list:
-                # Get the parameter type.
-                parameter_type = command_list[-1]
+        if command not in ACCEPTED_COMMANDS_TYPES:
+            return
 
-                # Run the command.
-                if parameter is not None:
-                    await getattr(self, f"async_{command}")(parameter_type(parameter))
+        # Get the parameter type.
+        parameter_type = ACCEPTED_COMMANDS_TYPES[command]
 
-                elif parameter_type is None:
-                    await getattr(self, f"async_{command}")()
+        # Run the command.
+        if parameter is not None:
+            await getattr(self, f"async_{command}")(parameter_type(parameter))
+
+        elif parameter_type is None:
+            await getattr(self, f"async_{command}")()
 
     async def async_beolink_leader_command(
         self, command: str, parameter: str | None = None
     ) -> None:
         """Send a command to the Beolink leader."""
-        for command_list in ACCEPTED_COMMANDS_LISTS:
-            if command in command_list:
-                # Get the parameter type.
-                parameter_type = command_list[-1]
-
-                # Check for valid parameter type.
-                if parameter_type is not None:
-                    try:
-                        parameter = parameter_type(parameter)
-                    except (ValueError, TypeError):
-                        _LOGGER.error("Invalid parameter")
-                        return
-
-                elif parameter_type is None and parameter is not None:
-                    _LOGGER.error("Invalid parameter")
-                    return
-
-                # Forward the command to the leader if a listener.
-                if self._remote_leader is not None:
-                    async_dispatcher_send(
-                        self.hass,
-                        f"{self._remote_leader.jid}_{BEOLINK_LEADER_COMMAND}",
-                        command,
-                        parameter,
-                    )
+        if command not in ACCEPTED_COMMANDS_TYPES:
+            return
 
-                # Run the command if leader.
-                elif parameter is not None:
-                    await getattr(self, f"async_{command}")(parameter_type(parameter))
+        # Get the parameter type.
+        parameter_type = ACCEPTED_COMMANDS_TYPES[command]
 
-                elif parameter_type is None:
-                    await getattr(self, f"async_{command}")()
+        # Check for valid parameter type.
+        if parameter_type is not None:
+            try:
+                parameter = parameter_type(parameter)
+            except (ValueError, TypeError):
+                _LOGGER.error("Invalid parameter")
+                return
+
+        elif parameter_type is None and parameter is not None:
+            _LOGGER.error("Invalid parameter")
+            return
+
+        # Forward the command to the leader if a listener.
+        if self._remote_leader is not None:
+            async_dispatcher_send(
+                self.hass,
+                self._remote_leader_signals[BEOLINK_LEADER_COMMAND],
+                command,
+                parameter,
+            )
+
+        # Run the command if leader.
+        elif parameter is not None:
+            await getattr(self, f"async_{command}")(parameter_type(parameter))
+
+        elif parameter_type is None:
+            await getattr(self, f"async_{command}")()
 
     async def async_beolink_set_volume(self, volume_level: str) -> None:
         """Set volume level for all connected Beolink devices."""
@@ -1262,17 +1439,17 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
         if self._remote_leader is not None:
             async_dispatcher_send(
                 self.hass,
-                f"{self._remote_leader.jid}_{BEOLINK_VOLUME}",
+                self._remote_leader_signals[BEOLINK_VOLUME],
                 volume_level,
             )
 
         else:
             await self.async_set_volume_level(volume=float(volume_level))
 
-            for beolink_listener in self._beolink_listeners:
+            for signal in self._beolink_listener_signals:
                 async_dispatcher_send(
                     self.hass,
-                    f"{beolink_listener.jid}_{BEOLINK_LISTENER_COMMAND}",
+                    signal,
                     "set_volume_level",
                     volume_level,
                 )
@@ -1301,17 +1478,17 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
         if self._remote_leader is not None:
             async_dispatcher_send(
                 self.hass,
-                f"{self._remote_leader.jid}_{BEOLINK_RELATIVE_VOLUME}",
+                self._remote_leader_signals[BEOLINK_RELATIVE_VOLUME],
                 volume_level,
             )
 
         else:
             await self.async_set_relative_volume_level(volume=float(volume_level))
 
-            for beolink_listener in self._beolink_listeners:
+            for signal in self._beolink_listener_signals:
                 async_dispatcher_send(
                     self.hass,
-                    f"{beolink_listener.jid}_{BEOLINK_LISTENER_COMMAND}",
+                    signal,
                     "set_relative_volume_level",
                     volume_level,
                 )
@@ -1341,11 +1518,14 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, BangOlufsenEntity):
         if absolute_volume:
             volume = absolute_volume
         elif volume_offset:
+            level = self._volume.level
+            current_volume = level.level if level else None
+
             # Ensure that the volume is not above 100
-            if not self._volume.level or not self._volume.level.level:
+            if not current_volume:
                 _LOGGER.warning("Error setting volume")
             else:
-                volume = min(self._volume.level.level + volume_offset, 100)
+                volume = min(current_volume + volume_offset, 100)
 
         if uri:
             media_id = uri
@@ -1,8 +1,8 @@
 """Select entities for the Bang & Olufsen Mozart integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from multiprocessing.pool import ApplyResult
 from typing import cast
 
 from mozart_api.models import (
@@ -16,7 +16,8 @@ from mozart_api.models import (
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -53,6 +54,60 @@ class BangOlufsenSelect(BangOlufsenEntity, SelectEntity):
         self._attr_current_option = None
         self._attr_options = []
 
+        self._update_debouncer: Debouncer | None = None
+        self._update_requested: bool = False
+
+    async def async_added_to_hass(self) -> None:
+        """Turn on the dispatchers."""
+        await super().async_added_to_hass()
+
+        # Collapse bursts of notifications into a single update with fresh data.
+        self._update_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=0.05,
+            immediate=False,
+            function=self._refresh,
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Turn off the dispatchers and cancel any scheduled updates."""
+        await super().async_will_remove_from_hass()
+
+        if self._update_debouncer is not None:
+            self._update_debouncer.async_cancel()
+
+    async def _request_update(self) -> None:
+        """Request a debounced update of the options."""
+        self._update_requested = True
+
+        await cast(Debouncer, self._update_debouncer).async_call()
+
+    async def _refresh(self) -> None:
+        """Update the options."""
+        # The debouncer drops calls made while an update is running, so update again if requested meanwhile.
+        while self._update_requested:
+            self._update_requested = False
+            await self._update_options()
+
+    async def _update_options(self) -> None:
+        """Update the options and selected option."""
+        raise NotImplementedError
+
+    @callback
+    def _set_options(self, options: list[str], current_option: str | None) -> None:
+        """Set the options and selected option. Only write the state if either changed."""
+        if (
+            options == self._attr_options
+            and current_option == self._attr_current_option
+        ):
+            return
+
+        self._attr_options = options
+        self._attr_current_option = current_option
+
+        self.async_write_ha_state()
+
 
 class BangOlufsenSelectSoundMode(BangOlufsenSelect):
     """Sound mode Select."""
@@ -66,6 +121,7 @@ class BangOlufsenSelectSoundMode(BangOlufsenSelect):
 
         self._attr_unique_id = f"{self._unique_id}-sound-mode"
 
+        self._active_sound_mode: ListeningModeProps | None = None
         self._sound_modes: dict[str, int] = {}
 
     async def async_added_to_hass(self) -> None:
@@ -76,11 +132,11 @@ class BangOlufsenSelectSoundMode(BangOlufsenSelect):
             async_dispatcher_connect(
                 self.hass,
                 f"{self._unique_id}_{WEBSOCKET_NOTIFICATION.ACTIVE_LISTENING_MODE}",
-                self._update_sound_modes,
+                self._update_active_sound_mode,
             )
         )
 
-        await self._update_sound_modes()
+        await self._update_options()
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
@@ -88,19 +144,37 @@ class BangOlufsenSelectSoundMode(BangOlufsenSelect):
             id=self._sound_modes[option], async_req=True
         )
 
-    async def _update_sound_modes(
-        self, active_sound_mode: ListeningModeProps | ListeningModeRef | None = None
+    async def _update_active_sound_mode(
+        self, active_sound_mode: ListeningModeProps
     ) -> None:
+        """Request an update with the new active sound mode."""
+        self._active_sound_mode = active_sound_mode
+
+        await self._request_update()
+
+    async def _update_options(self) -> None:
         """Get the available sound modes and setup Select functionality."""
-        sound_modes = cast(
-            ApplyResult[list[ListeningMode]],
-            self._client.get_listening_mode_set(async_req=True),
-        ).get()
+        sound_modes: list[ListeningMode]
+        active_sound_mode: ListeningModeProps | ListeningModeRef | None
+
+        # Use the active sound mode from a notification if available.
+        active_sound_mode = self._active_sound_mode
+        self._active_sound_mode = None
+
         if active_sound_mode is None:
-            active_sound_mode = cast(
-                ApplyResult[ListeningModeRef],
-                self._client.get_active_listening_mode(async_req=True),
-            ).get()
+            sound_modes, active_sound_mode = await asyncio.gather(
+                self.hass.async_add_executor_job(self._client.get_listening_mode_set),
+                self.hass.async_add_executor_job(
+                    self._client.get_active_listening_mode
+                ),
+            )
+        else:
+            sound_modes = await self.hass.async_add_executor_job(
+                self._client.get_listening_mode_set
+            )
+
+        self._sound_modes = {}
+        current_option = self._attr_current_option
 
         # Add the key to make the labels unique as well
         for sound_mode in sound_modes:
@@ -109,12 +183,10 @@ class BangOlufsenSelectSoundMode(BangOlufsenSelect):
             self._sound_modes[label] = sound_mode.id
 
             if sound_mode.id == active_sound_mode.id:
-                self._attr_current_option = label
+                current_option = label
 
         # Set available options and selected option.
-        self._attr_options = list(self._sound_modes.keys())
-
-        self.async_write_ha_state()
+        self._set_options(list(self._sound_modes), current_option)
 
 
 class BangOlufsenSelectListeningPosition(BangOlufsenSelect):
@@ -129,8 +201,10 @@ class BangOlufsenSelectListeningPosition(BangOlufsenSelect):
 
         self._attr_unique_id = f"{self._unique_id}-listening-position"
 
+        self._active_speaker_group: SpeakerGroupOverview | None = None
         self._listening_positions: dict[str, str] = {}
         self._scenes: dict[str, str] = {}
+        self._scenes_fingerprint: tuple | None = None
 
     async def async_added_to_hass(self) -> None:
         """Turn on the dispatchers."""
@@ -141,17 +215,17 @@ class BangOlufsenSelectListeningPosition(BangOlufsenSelect):
                 async_dispatcher_connect(
                     self.hass,
                     f"{self._unique_id}_{WEBSOCKET_NOTIFICATION.ACTIVE_SPEAKER_GROUP}",
-                    self._update_listening_positions,
+                    self._update_active_speaker_group,
                 ),
                 async_dispatcher_connect(
                     self.hass,
                     f"{self._unique_id}_{WEBSOCKET_NOTIFICATION.REMOTE_MENU_CHANGED}",
-                    self._update_listening_positions,
+                    self._request_update,
                 ),
             ]
         )
 
-        await self._update_listening_positions()
+        await self._update_options()
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
@@ -159,47 +233,69 @@ class BangOlufsenSelectListeningPosition(BangOlufsenSelect):
             id=self._listening_positions[option], async_req=True
         )
 
-    async def _update_listening_positions(
-        self, active_speaker_group: SpeakerGroupOverview | None = None
+    async def _update_active_speaker_group(
+        self, active_speaker_group: SpeakerGroupOverview
     ) -> None:
+        """Request an update with the new active speaker group."""
+        self._active_speaker_group = active_speaker_group
+
+        await self._request_update()
+
+    async def _update_options(self) -> None:
         """Update listening position."""
-        scenes = cast(
-            ApplyResult[dict[str, Scene]], self._client.get_all_scenes(async_req=True)
-        ).get()
+        scenes: dict[str, Scene]
+
+        # Use the active speaker group from a notification if available.
+        active_speaker_group = self._active_speaker_group
+        self._active_speaker_group = None
 
         if active_speaker_group is None:
-            active_speaker_group = cast(
-                ApplyResult[SpeakerGroupOverview],
-                self._client.get_speakergroup_active(async_req=True),
-            ).get()
+            scenes, active_speaker_group = await asyncio.gather(
+                self.hass.async_add_executor_job(self._client.get_all_scenes),
+                self.hass.async_add_executor_job(self._client.get_speakergroup_active),
+            )
+        else:
+            scenes = await self.hass.async_add_executor_job(self._client.get_all_scenes)
+
+        # Listening positions
+        listening_position_scenes = [
+            (scene_key, scene)
+            for scene_key, scene in scenes.items()
+            if scene.tags is not None
+            and "listeningposition" in scene.tags
+            and scene.label is not None
+        ]
+
+        # Skip the update if neither the listening positions nor the active speaker group changed.
+        fingerprint = (
+            active_speaker_group.id,
+            tuple(
+                (scene_key, scene.label, scene.action_list[0].speaker_group_id)
+                for scene_key, scene in listening_position_scenes
+            ),
+        )
+        if fingerprint == self._scenes_fingerprint:
+            return
+
+        self._scenes_fingerprint = fingerprint
 
         self._listening_positions = {}
+        current_option = self._attr_current_option
 
-        # Listening positions
-        for scene_key in scenes:
-            scene = scenes[scene_key]
-
-            if (
-                scene.tags is not None
-                and "listeningposition" in scene.tags
-                and scene.label is not None
-            ):
-                # Ignore listening positions with the same name
-                if scene.label is not None:
-                    if scene.label in self._listening_positions:
-                        _LOGGER.warning(
-                            "Ignoring listening position with duplicate name: %s and ID: %s",
-                            scene.label,
-                            scene_key,
-                        )
-                        continue
-
-                    self._listening_positions[scene.label] = scene_key
-
-                # Currently guess the current active listening position by the speakergroup ID
-                if active_speaker_group.id == scene.action_list[0].speaker_group_id:
-                    self._attr_current_option = scene.label
-
-        self._attr_options = list(self._listening_positions.keys())
+        for scene_key, scene in listening_position_scenes:
+            # Ignore listening positions with the same name
+            if scene.label in self._listening_positions:
+                _LOGGER.warning(
+                    "Ignoring listening position with duplicate name: %s and ID: %s",
+                    scene.label,
+                    scene_key,
+                )
+                continue
 
-        self.async_write_ha_state()
+            self._listening_positions[scene.label] = scene_key
+
+            # Currently guess the current active listening position by the speakergroup ID
+            if active_speaker_group.id == scene.action_list[0].speaker_group_id:
+                current_option = scene.label
+
+        self._set_options(list(self._listening_positions), current_option)
@@ -3,9 +3,6 @@
 
 from __future__ import annotations
 
-from multiprocessing.pool import ApplyResult
-from typing import cast
-
 from mozart_api.models import BeolinkPeer, HomeControlUri, ProductFriendlyName
 
 from homeassistant.components.text import TextEntity
@@ -80,9 +77,9 @@ class BangOlufsenTextFriendlyName(BangOlufsenText):
 
     async def _update_friendly_name(self, _: str | None) -> None:
         """Update text value."""
-        beolink_self = cast(
-            ApplyResult[BeolinkPeer], self._client.get_beolink_self(async_req=True)
-        ).get()
+        beolink_self: BeolinkPeer = await self.hass.async_add_executor_job(
+            self._client.get_beolink_self
+        )
 
         self._attr_native_value = beolink_self.friendly_name
 